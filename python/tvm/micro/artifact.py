@@ -45,6 +45,12 @@ class ArchiveModifiedError(Exception):
     """Raised when the underlying files in a metadata-only archive were modified after archiving."""
 
 
+# Size of the read buffer used when extracting artifact archives. tarfile reads 512-byte headers
+# one at a time; a large buffer lets those reads be served from memory instead of the kernel. The
+# same size is used as tarfile's per-member copy chunk size, which otherwise defaults to 16 KiB.
+_ARCHIVE_READ_BUFFER_SIZE = 1 * 1024 * 1024
+
+
 def sha256_hexdigest(path):
     with open(path, "rb") as path_fd:
         h = hashlib.sha256()
@@ -113,8 +119,11 @@ class Artifact:
         temp_dir = os.path.join(base_dir_parent, f"__tvm__{base_dir_name}")
         os.mkdir(temp_dir)
         try:
-            with tarfile.open(archive_path) as tar_f:
-                tar_f.extractall(temp_dir)
+            with open(archive_path, "rb", buffering=_ARCHIVE_READ_BUFFER_SIZE) as archive_f:
+                with tarfile.open(fileobj=archive_f) as tar_f:
+                    # Python releases predating copybufsize simply ignore this attribute.
+                    tar_f.copybufsize = _ARCHIVE_READ_BUFFER_SIZE
+                    tar_f.extractall(temp_dir)
 
                 temp_dir_contents = os.listdir(temp_dir)
                 if len(temp_dir_contents) != 1:
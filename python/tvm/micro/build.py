@@ -159,7 +159,6 @@ def build_static_runtime(
 
     mod_build_dir = workspace.relpath(os.path.join("build", "module"))
     os.makedirs(mod_build_dir)
-    mod_src_dir = workspace.relpath(os.path.join("src", "module"))
 
     libs = []
     for mod_or_src_dir in (extra_libs or []) + RUNTIME_LIB_SRC_DIRS:
@@ -17,7 +17,7 @@
 
 """Defines common helper functions useful for integrating custom compiler toolchains."""
 
-import glob
+import fnmatch
 import os
 import shutil
 
@@ -45,12 +45,18 @@ def populate_tvm_objs(dest_dir, objs):
         List of paths, each relative to  `dest_dir` to the newly-copied MicroLibrary files.
     """
     copied = []
-    for p in GLOB_PATTERNS:
-        for f in glob.glob(os.path.join(dest_dir, p)):
-            if os.path.isdir(f):
-                shutil.rmtree(f)
-            else:
-                os.unlink(f)
+    # A single scandir() pass reports each entry's type without the extra stat() per match that
+    # glob() followed by os.path.isdir() needs.
+    with os.scandir(dest_dir) as dir_entries:
+        to_remove = [
+            e for e in dir_entries if any(fnmatch.fnmatch(e.name, p) for p in GLOB_PATTERNS)
+        ]
+
+    for entry in to_remove:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
 
     for obj in objs:
         for lib_file in obj.library_files:
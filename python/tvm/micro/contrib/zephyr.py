@@ -58,6 +58,18 @@ class SubprocessEnv(object):
         return subprocess.check_output(cmd, env=env, **kw)
 
 
+def _make_parallel_args():
+    """Return make arguments for a parallel build.
+
+    The job count defaults to the number of CPUs and can be overridden with the
+    TVM_MICRO_MAKE_JOBS environment variable. New jobs are not started while the load average
+    exceeds the number of CPUs.
+    """
+    num_cpus = multiprocessing.cpu_count()
+    num_jobs = int(os.environ.get("TVM_MICRO_MAKE_JOBS", num_cpus))
+    return [f"-j{num_jobs}", "-l", str(num_cpus)]
+
+
 class ProjectNotFoundError(Exception):
     """Raised when the project_dir supplied to ZephyrCompiler does not exist."""
 
@@ -198,9 +210,8 @@ class ZephyrCompiler(tvm.micro.Compiler):
             ["cmake", "..", f"-DBOARD={self._board}"] + self._options_to_cmake_args(options),
             cwd=build_dir,
         )
-        num_cpus = multiprocessing.cpu_count()
         self._subprocess_env.run(
-            ["make", f"-j{num_cpus}", "VERBOSE=1", project_name], cwd=build_dir
+            ["make"] + _make_parallel_args() + ["VERBOSE=1", project_name], cwd=build_dir
         )
         return tvm.micro.MicroLibrary(build_dir, [f"lib{project_name}.a"])
 
@@ -224,7 +235,7 @@ class ZephyrCompiler(tvm.micro.Compiler):
         cmake_args.append(f'-DTVM_LIBS={";".join(copied_libs)}')
         self._subprocess_env.run(cmake_args, cwd=output)
 
-        self._subprocess_env.run(["make"], cwd=output)
+        self._subprocess_env.run(["make"] + _make_parallel_args(), cwd=output)
 
         return tvm.micro.MicroBinary(
             output,
@@ -211,6 +211,10 @@ class TransportLogger(Transport):
         return self.child.close()
 
     def read(self, n, timeout_sec):
+        # Skip formatting the hex dump entirely when the record would be discarded.
+        if not self.logger.isEnabledFor(self.level):
+            return self.child.read(n, timeout_sec)
+
         timeout_str = f"{timeout_sec:5.2f}s" if timeout_sec is not None else " None "
         try:
             data = self.child.read(n, timeout_sec)
@@ -261,6 +265,9 @@ class TransportLogger(Transport):
         return data
 
     def write(self, data, timeout_sec):
+        if not self.logger.isEnabledFor(self.level):
+            return self.child.write(data, timeout_sec)
+
         timeout_str = f"{timeout_sec:5.2f}s" if timeout_sec is not None else " None "
         try:
             bytes_written = self.child.write(data, timeout_sec)
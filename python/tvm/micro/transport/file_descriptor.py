@@ -17,9 +17,8 @@
 
 """Defines an implementation of Transport that uses file descriptors."""
 
-import fcntl
 import os
-import select
+import selectors
 import time
 from . import base
 
@@ -36,22 +35,24 @@ class FdTransport(base.Transport):
         file_descriptor = (
             file_descriptor if isinstance(file_descriptor, int) else file_descriptor.fileno()
         )
-        flag = fcntl.fcntl(file_descriptor, fcntl.F_GETFL)
-        if flag & os.O_NONBLOCK != 0:
-            return file_descriptor
-
-        fcntl.fcntl(file_descriptor, fcntl.F_SETFL, os.O_NONBLOCK | flag)
-        new_flag = fcntl.fcntl(file_descriptor, fcntl.F_GETFL)
-        if (new_flag & os.O_NONBLOCK) == 0:
+        try:
+            os.set_blocking(file_descriptor, False)
+        except OSError as err:
             raise FdConfigurationError(
                 f"Cannot set file descriptor {file_descriptor} to non-blocking"
-            )
+            ) from err
+
         return file_descriptor
 
     def __init__(self, read_fd, write_fd, timeouts):
         self.read_fd = self._validate_configure_fd(read_fd)
         self.write_fd = self._validate_configure_fd(write_fd)
         self._timeouts = timeouts
+        # Register each fd once, rather than rebuilding select() fd sets on every read/write.
+        self._read_selector = selectors.DefaultSelector()
+        self._read_selector.register(self.read_fd, selectors.EVENT_READ)
+        self._write_selector = selectors.DefaultSelector()
+        self._write_selector.register(self.write_fd, selectors.EVENT_WRITE)
 
     def timeouts(self):
         return self._timeouts
@@ -61,21 +62,18 @@ class FdTransport(base.Transport):
 
     def close(self):
         if self.read_fd is not None:
+            self._read_selector.close()
             os.close(self.read_fd)
             self.read_fd = None
 
         if self.write_fd is not None:
+            self._write_selector.close()
             os.close(self.write_fd)
             self.write_fd = None
 
-    def _await_ready(self, rlist, wlist, timeout_sec=None, end_time=None):
-        if end_time is None:
-            return True
-
-        if timeout_sec is None:
-            timeout_sec = max(0, end_time - time.monotonic())
-        rlist, wlist, xlist = select.select(rlist, wlist, rlist + wlist, timeout_sec)
-        if not rlist and not wlist and not xlist:
+    def _await_ready(self, selector, end_time=None):
+        timeout_sec = None if end_time is None else max(0, end_time - time.monotonic())
+        if not selector.select(timeout_sec):
             raise base.IoTimeoutError()
 
         return True
@@ -86,7 +84,7 @@ class FdTransport(base.Transport):
 
         end_time = None if timeout_sec is None else time.monotonic() + timeout_sec
 
-        self._await_ready([self.read_fd], [], end_time=end_time)
+        self._await_ready(self._read_selector, end_time)
         to_return = os.read(self.read_fd, n)
 
         if not to_return:
@@ -101,14 +99,17 @@ class FdTransport(base.Transport):
 
         end_time = None if timeout_sec is None else time.monotonic() + timeout_sec
 
+        # Advance through a memoryview so short writes don't copy the remaining data.
+        data = memoryview(data)
         data_len = len(data)
-        while data:
-            self._await_ready(end_time, [], [self.write_fd])
-            num_written = os.write(self.write_fd, data)
+        offset = 0
+        while offset < data_len:
+            self._await_ready(self._write_selector, end_time)
+            num_written = os.write(self.write_fd, data[offset:])
             if not num_written:
                 self.close()
                 raise base.TransportClosedError()
 
-            data = data[num_written:]
+            offset += num_written
 
         return data_len
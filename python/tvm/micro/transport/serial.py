@@ -91,12 +91,17 @@ class SerialTransport(Transport):
 
     def read(self, n, timeout_sec):
         if timeout_sec is None:
+            # Block for the first byte only, then return whatever else the driver has buffered.
             self._port.timeout = None
-            return self._port.read(n)
+            to_return = self._port.read(1)
+            in_waiting = min(n - 1, self._port.in_waiting)
+            if in_waiting > 0:
+                to_return += self._port.read(in_waiting)
+            return to_return
 
         end_time = time.monotonic() + timeout_sec
         to_return = bytearray()
-        while True:
+        while len(to_return) < n:
             timeout_remaining = end_time - time.monotonic()
             if timeout_sec != 0 and timeout_remaining < 0:
                 break
@@ -105,13 +110,18 @@ class SerialTransport(Transport):
             # 5 is an arbitrary number.
             self._port.timeout = 1 / self._port.baudrate * 5
             try:
-                data = self._port.read(n if timeout_sec != 0 else 1)
-                if not data and to_return:
+                to_read = n - len(to_return)
+                if timeout_sec == 0:
+                    # Drain everything already buffered by the driver in a single read.
+                    to_read = min(to_read, max(1, self._port.in_waiting))
+
+                data = self._port.read(to_read)
+                if not data and (to_return or timeout_sec == 0):
                     break
 
                 to_return.extend(data)
             except serial.SerialTimeoutException:
-                if to_return:
+                if to_return or timeout_sec == 0:
                     break
 
         if not to_return:
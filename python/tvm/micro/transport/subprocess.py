@@ -17,11 +17,34 @@
 
 """Defines an implementation of Transport that uses subprocesses."""
 
+import fcntl
 import subprocess
+import sys
 from . import base
 from . import file_descriptor
 
 
+# Kernel buffer size requested for the subprocess pipes. The Linux default of 64 KiB causes bulk
+# transfers to wake FdTransport up once per 64 KiB.
+PIPE_SIZE_BYTES = 1 * 1024 * 1024
+
+
+# fcntl.F_SETPIPE_SZ is only exported by Python 3.10+; its value is fixed by the Linux ABI.
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031 if sys.platform.startswith("linux") else None)
+
+
+def _set_pipe_size(pipe_file):
+    """Try to grow the kernel buffer of a pipe to PIPE_SIZE_BYTES; keep the default on failure."""
+    if _F_SETPIPE_SZ is None:
+        return
+
+    try:
+        fcntl.fcntl(pipe_file.fileno(), _F_SETPIPE_SZ, PIPE_SIZE_BYTES)
+    except OSError:
+        # Sizes above /proc/sys/fs/pipe-max-size are rejected for unprivileged users.
+        pass
+
+
 class SubprocessFdTransport(file_descriptor.FdTransport):
     def timeouts(self):
         raise NotImplementedError()
@@ -50,6 +73,8 @@ class SubprocessTransport(base.Transport):
         self.kwargs["stdin"] = subprocess.PIPE
         self.kwargs["bufsize"] = 0
         self.popen = subprocess.Popen(self.args, **self.kwargs)
+        _set_pipe_size(self.popen.stdin)
+        _set_pipe_size(self.popen.stdout)
         self.child_transport = SubprocessFdTransport(
             self.popen.stdout, self.popen.stdin, self.timeouts()
         )
@@ -60,8 +85,16 @@ class SubprocessTransport(base.Transport):
     def read(self, n, timeout_sec):
         return self.child_transport.read(n, timeout_sec)
 
+    # Number of seconds to wait for the subprocess to exit after SIGTERM before sending SIGKILL.
+    TERMINATE_TIMEOUT_SEC = 1.0
+
     def close(self):
         if self.child_transport is not None:
             self.child_transport.close()
 
         self.popen.terminate()
+        try:
+            self.popen.wait(timeout=self.TERMINATE_TIMEOUT_SEC)
+        except subprocess.TimeoutExpired:
+            self.popen.kill()
+            self.popen.wait()
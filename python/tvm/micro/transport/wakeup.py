@@ -18,6 +18,7 @@
 """Defines an implementation of Transport that uses subprocesses."""
 
 import logging
+import re
 import time
 from . import base
 
@@ -28,12 +29,21 @@ _LOG = logging.getLogger(__name__)
 class WakeupTransport(base.Transport):
     """A Transport implementation that waits for a "wakeup sequence" from the remote end."""
 
+    # Maximum number of bytes requested from the child transport per read() while searching for
+    # the wakeup sequence.
+    WAKEUP_READ_SIZE = 4096
+
+    # Bytes which terminate a line of console output logged while awaiting the wakeup sequence.
+    LINE_END_RE = re.compile(b"[\n\xff]")
+
     def __init__(self, child_transport, wakeup_sequence):
         self.child_transport = child_transport
         self.wakeup_sequence = bytes(wakeup_sequence)
         self.wakeup_sequence_buffer = bytearray()
         self.line_start_index = 0
         self.found_wakeup_sequence = False
+        # Data received after the wakeup sequence, returned by subsequent calls to read().
+        self.pending_data = b""
 
     def open(self):
         return self.child_transport.open()
@@ -51,13 +61,36 @@ class WakeupTransport(base.Transport):
             return max(0, end_time - time.monotonic())
 
         if not self.found_wakeup_sequence:
-            while self.wakeup_sequence not in self.wakeup_sequence_buffer:
-                x = self.child_transport.read(1, _time_remaining())
+            # Read in chunks rather than byte-by-byte to avoid one child read() per byte of console
+            # output. Anything received after the wakeup sequence is kept in pending_data.
+            search_start = 0
+            while True:
+                seq_index = self.wakeup_sequence_buffer.find(self.wakeup_sequence, search_start)
+
+                # Log console lines, stopping before the wakeup sequence and the RPC data after it.
+                # Until it's found, stop short of a trailing partial wakeup sequence, too.
+                if seq_index != -1:
+                    log_end = seq_index
+                else:
+                    log_end = len(self.wakeup_sequence_buffer) - len(self.wakeup_sequence) + 1
+                for match in self.LINE_END_RE.finditer(
+                    self.wakeup_sequence_buffer, self.line_start_index, log_end
+                ):
+                    _LOG.debug(
+                        "%s", self.wakeup_sequence_buffer[self.line_start_index : match.start()]
+                    )
+                    self.line_start_index = match.end()
+
+                if seq_index != -1:
+                    break
+
+                search_start = max(0, len(self.wakeup_sequence_buffer) - len(self.wakeup_sequence))
+                x = self.child_transport.read(self.WAKEUP_READ_SIZE, _time_remaining())
                 self.wakeup_sequence_buffer.extend(x)
-                if x[0] in (b"\n", b"\xff"):
-                    _LOG.debug("%s", self.wakeup_sequence_buffer[self.line_start_index : -1])
-                    self.line_start_index = len(self.wakeup_sequence_buffer)
 
+            seq_end = seq_index + len(self.wakeup_sequence)
+            self.pending_data = bytes(self.wakeup_sequence_buffer[seq_end:])
+            del self.wakeup_sequence_buffer[seq_end:]
             _LOG.info("remote side woke up!")
             self.found_wakeup_sequence = True
             time.sleep(0.2)
@@ -69,6 +102,11 @@ class WakeupTransport(base.Transport):
             end_time = None if timeout_sec is None else time.monotonic() + timeout_sec
             timeout_sec = self._await_wakeup(end_time)
 
+        if self.pending_data:
+            to_return = self.pending_data[:n]
+            self.pending_data = self.pending_data[n:]
+            return to_return
+
         return self.child_transport.read(n, timeout_sec)
 
     def write(self, data, timeout_sec):
@@ -18,8 +18,13 @@
 """Tests for common micro transports."""
 
 import logging
+import os
+import signal
 import sys
+import threading
+import time
 import unittest
+import unittest.mock
 
 import pytest
 
@@ -182,6 +187,220 @@ class TransportLoggerTests(unittest.TestCase):
             transport_logger.close()
             assert test_log.records[-1].getMessage() == "foo: closing transport"
 
+    def test_transport_logger_disabled_level(self):
+        """Tests that TransportLogger passes data through without formatting below its level."""
+
+        class RecordingHandler(logging.Handler):
+            def __init__(self):
+                super(RecordingHandler, self).__init__(level=logging.NOTSET)
+                self.records = []
+
+            def emit(self, record):
+                self.records.append(record)
+
+        logger = logging.getLogger("transport_logger_disabled_test")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        handler = RecordingHandler()
+        logger.addHandler(handler)
+        try:
+            transport = self.TestTransport()
+            transport_logger = tvm.micro.transport.TransportLogger(
+                "foo", transport, logger=logger, level=logging.DEBUG
+            )
+
+            with unittest.mock.patch.object(
+                tvm.micro.transport.TransportLogger,
+                "_to_hex",
+                side_effect=AssertionError("_to_hex called"),
+            ) as to_hex:
+                transport.to_return = b"data"
+                assert transport_logger.read(23, 3.0) == b"data"
+                transport.to_return = 3
+                assert transport_logger.write(b"data", 3.0) == 3
+
+            assert to_hex.call_count == 0
+            assert handler.records == []
+        finally:
+            logger.removeHandler(handler)
+
+
+@tvm.testing.requires_micro
+class WakeupTransportTests(unittest.TestCase):
+    import tvm.micro
+
+    class ChunkTransport(tvm.micro.transport.Transport):
+        def __init__(self, chunks):
+            self.chunks = list(chunks)
+
+        def open(self):
+            pass
+
+        def close(self):
+            pass
+
+        def timeouts(self):
+            raise NotImplementedError()
+
+        def read(self, n, timeout_sec):
+            chunk = self.chunks.pop(0)
+            assert len(chunk) <= n
+            return chunk
+
+        def write(self, data, timeout_sec):
+            return len(data)
+
+    def test_wakeup_sequence_split_across_reads(self):
+        """Tests that data following the wakeup sequence is returned by read()."""
+        from tvm.micro.transport import wakeup
+
+        child = self.ChunkTransport([b"boot log\nwa", b"keupda\n", b"ta", b"more"])
+        transport = wakeup.WakeupTransport(child, b"wakeup")
+        with self.assertLogs(wakeup._LOG, level=logging.DEBUG) as test_log:
+            assert transport.read(1, None) == b"d"
+
+        # Only console output preceding the wakeup sequence is logged.
+        assert [r.getMessage() for r in test_log.records] == [
+            "bytearray(b'boot log')",
+            "remote side woke up!",
+        ]
+        assert transport.read(10, None) == b"a\n"
+        assert transport.read(10, None) == b"ta"
+        assert transport.read(10, None) == b"more"
+
+
+@tvm.testing.requires_micro
+class FdTransportTests(unittest.TestCase):
+    # Larger than the default Linux (64 KiB) and macOS (16 KiB) pipe buffers, so writes of this size
+    # can only complete by waiting for the reader.
+    LARGE_PAYLOAD_SIZE = 1024 * 1024
+
+    def setUp(self):
+        from tvm.micro.transport import file_descriptor
+
+        self.to_transport_r, self.to_transport_w = os.pipe()
+        self.from_transport_r, self.from_transport_w = os.pipe()
+        self.transport = file_descriptor.FdTransport(
+            self.to_transport_r, self.from_transport_w, None
+        )
+
+    def tearDown(self):
+        self.transport.close()
+        os.close(self.to_transport_w)
+        os.close(self.from_transport_r)
+
+    def _run_after(self, delay_sec, func):
+        thread = threading.Thread(target=lambda: (time.sleep(delay_sec), func()))
+        thread.start()
+        self.addCleanup(thread.join)
+        return thread
+
+    def test_read_write_timeout(self):
+        """Tests FdTransport read/write over pipes, including timeouts."""
+        with self.assertRaises(tvm.micro.transport.IoTimeoutError):
+            self.transport.read(8, 0.01)
+
+        os.write(self.to_transport_w, b"data")
+        assert self.transport.read(8, 1.0) == b"data"
+
+        assert self.transport.write(b"data", 1.0) == 4
+        assert os.read(self.from_transport_r, 8) == b"data"
+
+    def test_read_blocks_without_timeout(self):
+        """Tests that read() with timeout_sec=None blocks until data arrives."""
+        self._run_after(0.1, lambda: os.write(self.to_transport_w, b"data"))
+        assert self.transport.read(8, None) == b"data"
+
+    def test_write_waits_for_writable(self):
+        """Tests that write() waits for the reader to drain a full pipe."""
+        payload = bytes(range(256)) * (self.LARGE_PAYLOAD_SIZE // 256)
+        received = bytearray()
+
+        def _drain():
+            while len(received) < len(payload):
+                received.extend(os.read(self.from_transport_r, 65536))
+
+        drain_thread = self._run_after(0.1, _drain)
+        assert self.transport.write(payload, 5.0) == len(payload)
+        drain_thread.join()
+        assert bytes(received) == payload
+
+    def test_write_timeout_on_full_pipe(self):
+        """Tests that write() raises IoTimeoutError when the pipe stays full."""
+        with self.assertRaises(tvm.micro.transport.IoTimeoutError):
+            self.transport.write(b"\0" * self.LARGE_PAYLOAD_SIZE, 0.1)
+
+
+@tvm.testing.requires_micro
+class SerialTransportReadTests(unittest.TestCase):
+    class FakePort:
+        """Stands in for a pyserial Serial instance, holding data already received by the driver."""
+
+        baudrate = 115200
+
+        def __init__(self, data):
+            self.data = bytearray(data)
+            self.timeout = None
+            self.read_sizes = []
+
+        @property
+        def in_waiting(self):
+            return len(self.data)
+
+        def read(self, size):
+            self.read_sizes.append(size)
+            to_return = bytes(self.data[:size])
+            del self.data[:size]
+            return to_return
+
+    def _make_transport(self, data):
+        pytest.importorskip("serial")
+        from tvm.micro.transport import serial
+
+        transport = serial.SerialTransport(port_path="/dev/null")
+        transport._port = self.FakePort(data)
+        return transport
+
+    def test_read_no_timeout_drains_in_waiting(self):
+        """Tests that timeout_sec=None blocks for 1 byte, then returns what is buffered."""
+        transport = self._make_transport(b"abcdefgh")
+        assert transport.read(5, None) == b"abcde"
+        assert transport._port.read_sizes == [1, 4]
+        assert transport._port.timeout is None
+
+    def test_read_nonblocking(self):
+        """Tests that timeout_sec=0 returns buffered data in one read, or raises IoTimeoutError."""
+        transport = self._make_transport(b"abc")
+        assert transport.read(8, 0) == b"abc"
+        # One read drains in_waiting; the second waits 5 chars' time for more data and gets none.
+        assert transport._port.read_sizes == [3, 1]
+
+        with self.assertRaises(tvm.micro.transport.IoTimeoutError):
+            transport.read(8, 0)
+
+    def test_read_timeout_capped_at_n(self):
+        """Tests that a timed read never returns more than n bytes."""
+        transport = self._make_transport(b"abcdefgh")
+        assert transport.read(5, 1.0) == b"abcde"
+        assert transport._port.read_sizes == [5]
+        assert transport.read(5, 1.0) == b"fgh"
+
+
+@tvm.testing.requires_micro
+class SubprocessTransportTests(unittest.TestCase):
+    def test_close_kills_child_ignoring_sigterm(self):
+        """Tests that close() escalates to SIGKILL and reaps a child which ignores SIGTERM."""
+        transport = tvm.micro.transport.SubprocessTransport(
+            ["sh", "-c", "trap '' TERM; echo ready; while :; do sleep 0.05; done"]
+        )
+        transport.open()
+        # Wait until the trap is installed, so SIGTERM is guaranteed to be ignored.
+        assert transport.read(6, 5.0) == b"ready\n"
+
+        transport.close()
+        assert transport.popen.returncode is not None
+        assert transport.popen.returncode == -signal.SIGKILL
+
 
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__] + sys.argv[1:]))